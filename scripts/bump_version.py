@@ -7,6 +7,9 @@ import subprocess
 from pathlib import Path
 from datetime import datetime
 
+# Compile once at import so repeated calls skip the re module's cache lookup.
+_VERSION_RE = re.compile(r'version = "([\d.]+)"')
+
 
 def bump_version(version_type="patch"):
     """Bump version in pyproject.toml."""
@@ -14,7 +17,7 @@ def bump_version(version_type="patch"):
     content = pyproject_path.read_text()
 
     # Find current version
-    version_match = re.search(r'version = "([\d.]+)"', content)
+    version_match = _VERSION_RE.search(content)
     if not version_match:
         print("ERROR: Could not find version in pyproject.toml")
         sys.exit(1)
@@ -35,8 +38,11 @@ def bump_version(version_type="patch"):
 
     new_version = f"{major}.{minor}.{patch}"
 
-    # Update pyproject.toml
-    new_content = re.sub(r'version = "[\d.]+"', f'version = "{new_version}"', content)
+    # Update pyproject.toml; the exact old string is known, so a plain
+    # replace avoids a second regex scan of the file.
+    new_content = content.replace(
+        f'version = "{current_version}"', f'version = "{new_version}"', 1
+    )
     pyproject_path.write_text(new_content)
 
     # Update __init__.py if it has version
@@ -44,10 +50,10 @@ def bump_version(version_type="patch"):
     if init_path.exists():
         init_content = init_path.read_text()
         if "__version__" in init_content:
-            init_content = re.sub(
-                r'__version__ = "[\d.]+"',
+            init_content = init_content.replace(
+                f'__version__ = "{current_version}"',
                 f'__version__ = "{new_version}"',
-                init_content,
+                1,
             )
             init_path.write_text(init_content)
 
@@ -59,14 +65,11 @@ def update_changelog(version, version_type):
     """Update CHANGELOG.md."""
     changelog_path = Path("CHANGELOG.md")
 
-    # Get git log since last tag
-    try:
-        last_tag = subprocess.run(
-            ["git", "describe", "--tags", "--abbrev=0"], capture_output=True, text=True
-        ).stdout.strip()
-        log_cmd = ["git", "log", f"{last_tag}..HEAD", "--oneline", "--no-merges"]
-    except subprocess.CalledProcessError:
-        log_cmd = ["git", "log", "--oneline", "--no-merges", "-n", "20"]
+    # Get git log since last tag. "HEAD --not --tags" excludes everything
+    # reachable from a tag, so one subprocess covers both the tagged and the
+    # untagged-repo cases: commits since the last tag, or the full history
+    # when no tags exist.
+    log_cmd = ["git", "log", "--oneline", "--no-merges", "HEAD", "--not", "--tags"]
 
     commits = (
         subprocess.run(log_cmd, capture_output=True, text=True)
@@ -76,32 +79,33 @@ def update_changelog(version, version_type):
 
     # Create changelog entry
     today = datetime.now().strftime("%Y-%m-%d")
-    entry = f"## [{version}] - {today}\n\n"
+    parts = [f"## [{version}] - {today}\n\n"]
 
     if commits:
-        entry += "### Changes\n"
-        for commit in commits:
-            if commit:
-                entry += f"- {commit}\n"
+        parts.append("### Changes\n")
+        parts.extend(f"- {commit}\n" for commit in commits if commit)
     else:
-        entry += "### No changes recorded\n"
+        parts.append("### No changes recorded\n")
 
-    entry += "\n"
+    parts.append("\n")
+    entry = "".join(parts)
 
-    # Prepend to changelog
+    # Prepend to changelog: read the two-line header with readline, then
+    # splice the new entry in front of the remainder in a single write,
+    # instead of splitting the whole file into a list of lines.
     if changelog_path.exists():
-        old_content = changelog_path.read_text()
-    else:
-        old_content = "# Changelog\n\n"
-
-    # Insert after the header
-    lines = old_content.split("\n")
-    if lines[0].startswith("# Changelog"):
-        new_content = "\n".join(lines[:2]) + "\n\n" + entry + "\n".join(lines[2:])
+        with open(changelog_path, "rb") as f:
+            first = f.readline()
+            if first.startswith(b"# Changelog"):
+                second = f.readline()
+                tail = f.read()
+                new_bytes = first + second + b"\n" + entry.encode() + tail
+            else:
+                new_bytes = b"# Changelog\n\n" + entry.encode() + first + f.read()
     else:
-        new_content = "# Changelog\n\n" + entry + old_content
+        new_bytes = b"# Changelog\n\n\n" + entry.encode()
 
-    changelog_path.write_text(new_content)
+    changelog_path.write_bytes(new_bytes)
     print("Updated CHANGELOG.md")
 
 
@@ -114,11 +118,19 @@ def main():
     new_version = bump_version(version_type)
     update_changelog(new_version, version_type)
 
-    # Commit changes
+    # Commit changes ("--only" stages and commits the listed paths in one go)
     subprocess.run(
-        ["git", "add", "pyproject.toml", "CHANGELOG.md", "src/uhooapi/__init__.py"]
+        [
+            "git",
+            "commit",
+            "--only",
+            "pyproject.toml",
+            "CHANGELOG.md",
+            "src/uhooapi/__init__.py",
+            "-m",
+            f"Bump version to {new_version}",
+        ]
     )
-    subprocess.run(["git", "commit", "-m", f"Bump version to {new_version}"])
 
     print(f"\n✅ Version bumped to {new_version}")
     print("Run: git push origin main")
@@ -1,6 +1,15 @@
 """imports for device.py."""
 
 import re
+from functools import cache
+
+_CAMEL_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+@cache
+def _to_snake_case(key: str) -> str:
+    """Convert a camelCase key to snake_case, caching the result per key."""
+    return _CAMEL_RE.sub("_", key).lower()
 
 
 class Device:
@@ -31,6 +40,9 @@ class Device:
         "oxygen",
     ]
 
+    # Snake-case attribute per sensor field, computed once at class creation
+    ATTR_NAMES = {field: _to_snake_case(field) for field in SENSOR_FIELDS}
+
     # Add type hints for ALL sensor fields
     virus_index: float
     mold_index: float
@@ -58,15 +70,15 @@ class Device:
         self.user_settings: dict[str, str] = {"temp": "c"}  # default to celsius
 
         # Sensor averages (initialized to 0.0)
-        for field in self.SENSOR_FIELDS:
-            setattr(self, self._to_attr_name(field), 0.0)
+        for attr in self.ATTR_NAMES.values():
+            setattr(self, attr, 0.0)
         self.timestamp: int = -1
 
         self.update_device(device)
 
     def _to_attr_name(self, key: str) -> str:
         """Convert JSON-style keys to Python attributes (camelCase → snake_case)."""
-        return re.sub(r"(?<!^)(?=[A-Z])", "_", key).lower()
+        return _to_snake_case(key)
 
     def update_device(self, device: dict) -> None:
         """Update method for device info."""
@@ -94,9 +106,8 @@ class Device:
                     sums[field] += value
 
         # Assign averages to class attributes
-        for field in self.SENSOR_FIELDS:
-            avg = sums[field] / n
-            setattr(self, self._to_attr_name(field), round(avg, 1))
+        for field, attr in self.ATTR_NAMES.items():
+            setattr(self, attr, round(sums[field] / n, 1))
 
         # Optionally use the latest timestamp
         self.timestamp = data_points[-1].get("timestamp", -1)
@@ -1,29 +1,105 @@
+import logging
+import operator
 import pytest
-import asyncio
-from unittest.mock import AsyncMock
-from aiohttp import ClientSession
+from types import MappingProxyType
+from unittest.mock import AsyncMock, MagicMock
 
+from uhooapi.client import Client
+from uhooapi.device import Device
 
-@pytest.fixture
-def event_loop():
-    """Create an instance of the default event loop for each test case."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
+# Sample payloads are built once at import and frozen; tests never mutate
+# them, so the session-scoped fixtures can share them outright.
+_SAMPLE_DEVICE_DATA = MappingProxyType({
+    "deviceName": "Living Room",
+    "macAddress": "AA:BB:CC:DD:EE:FF",
+    "serialNumber": "UHOO12345",
+    "floorNumber": 1,
+    "roomName": "Living Room",
+    "timezone": "America/New_York",
+    "utcOffset": "-05:00",
+    "ssid": "HomeWiFi",
+})
 
-@pytest.fixture
-def mock_websession():
-    """Mock aiohttp ClientSession."""
-    session = AsyncMock(spec=ClientSession)
-    session.request = AsyncMock()
-    return session
+_SAMPLE_SENSOR_DATA = MappingProxyType({
+    "data": (
+        MappingProxyType({
+            "virusIndex": 2.5,
+            "moldIndex": 1.8,
+            "temperature": 22.5,
+            "humidity": 45.0,
+            "pm25": 12.3,
+            "tvoc": 150.0,
+            "co2": 800,
+            "co": 0.5,
+            "airPressure": 1013.25,
+            "ozone": 0.02,
+            "no2": 0.01,
+            "pm1": 5.6,
+            "pm4": 8.9,
+            "pm10": 15.2,
+            "ch2o": 0.03,
+            "light": 300,
+            "sound": 40,
+            "h2s": 0.001,
+            "no": 0.005,
+            "so2": 0.002,
+            "nh3": 0.008,
+            "oxygen": 20.9,
+            "timestamp": 1704067200,
+        }),
+        MappingProxyType({
+            "virusIndex": 2.6,
+            "moldIndex": 1.9,
+            "temperature": 22.6,
+            "humidity": 45.5,
+            "pm25": 12.5,
+            "tvoc": 155.0,
+            "co2": 810,
+            "co": 0.6,
+            "airPressure": 1013.30,
+            "ozone": 0.021,
+            "no2": 0.011,
+            "pm1": 5.7,
+            "pm4": 9.0,
+            "pm10": 15.5,
+            "ch2o": 0.031,
+            "light": 310,
+            "sound": 42,
+            "h2s": 0.0011,
+            "no": 0.0051,
+            "so2": 0.0021,
+            "nh3": 0.0081,
+            "oxygen": 20.91,
+            "timestamp": 1704067260,
+        }),
+    ),
+    "usersettings": MappingProxyType({
+        "temperature": "°C",
+        "temp": "c",
+        "humidity": "%",
+        "pm25": "µg/m^3",
+        "dust": "µg/m^3",
+        "tvoc": "ppb",
+        "voc": "ppb",
+        "co2": "ppm",
+        "co": "ppm",
+        "airPressure": "mbar",
+        "ozone": "ppb",
+        "no2": "ppb",
+    }),
+})
 
+# Kept a plain dict: Client.login feeds it through json_pp, which cannot
+# serialize a mappingproxy.
+_SAMPLE_TOKEN_RESPONSE = {
+    "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+    "refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
+    "token_type": "Bearer",
+    "expires_in": 3600,
+}
 
-@pytest.fixture
-def sample_device_data():
-    """Sample device data from API."""
-    return {
+_SAMPLE_DEVICE_LIST = (
+    MappingProxyType({
         "deviceName": "Living Room",
         "macAddress": "AA:BB:CC:DD:EE:FF",
         "serialNumber": "UHOO12345",
@@ -32,115 +108,198 @@ def sample_device_data():
         "timezone": "America/New_York",
         "utcOffset": "-05:00",
         "ssid": "HomeWiFi",
-    }
+    }),
+    MappingProxyType({
+        "deviceName": "Bedroom",
+        "macAddress": "FF:EE:DD:CC:BB:AA",
+        "serialNumber": "UHOO67890",
+        "floorNumber": 2,
+        "roomName": "Master Bedroom",
+        "timezone": "America/New_York",
+        "utcOffset": "-05:00",
+        "ssid": "HomeWiFi",
+    }),
+)
+
+
+@pytest.fixture(autouse=True)
+def _log_isolation():
+    """Restore the package logger's handlers and level after each test.
+
+    Client(debug=True) raises the level on the shared uhooapi logger, which
+    would otherwise leak into every later test.
+    """
+    logger = logging.getLogger("uhooapi")
+    saved_handlers = logger.handlers[:]
+    saved_level = logger.level
+    yield
+    logger.handlers[:] = saved_handlers
+    logger.setLevel(saved_level)
+
+
+class _StubSession:
+    """Bare-bones ClientSession stand-in.
+
+    `request` is the only attribute the code under test touches; a plain
+    class with one AsyncMock is far lighter than a spec'd AsyncMock, which
+    introspects the whole ClientSession API on creation.
+    """
+
+    def __init__(self):
+        self.request = AsyncMock()
+
+
+@pytest.fixture(scope="session")
+def mock_websession():
+    """Stub aiohttp ClientSession, shared across the session.
+
+    Per-test request state is reset by make_mock_response.
+    """
+    return _StubSession()
+
+
+class FakeAPI:
+    """Minimal stand-in for API: plays back canned results and records calls.
+
+    Much cheaper than AsyncMock, whose every attribute access synthesizes a
+    child mock. Per-method results go in `returns`; ordered queues of results
+    or exceptions go in `side_effects`.
+    """
+
+    def __init__(self):
+        self.calls = []
+        self.returns = {}
+        self.side_effects = {}
+
+    def _dispatch(self, name, *args, **kwargs):
+        self.calls.append((name, args, kwargs))
+        queued = self.side_effects.get(name)
+        if queued:
+            value = queued.pop(0)
+            if isinstance(value, BaseException):
+                raise value
+            return value
+        return self.returns.get(name)
+
+    def calls_to(self, name):
+        """Return the recorded (name, args, kwargs) calls to one method."""
+        return [call for call in self.calls if call[0] == name]
+
+    async def generate_token(self, *args, **kwargs):
+        return self._dispatch("generate_token", *args, **kwargs)
+
+    async def get_device_list(self, *args, **kwargs):
+        return self._dispatch("get_device_list", *args, **kwargs)
+
+    async def get_device_data(self, *args, **kwargs):
+        return self._dispatch("get_device_data", *args, **kwargs)
+
+    def set_bearer_token(self, *args, **kwargs):
+        self._dispatch("set_bearer_token", *args, **kwargs)
 
 
 @pytest.fixture
-def sample_sensor_data():
-    """Sample sensor data from API."""
-    return {
-        "data": [
-            {
-                "virusIndex": 2.5,
-                "moldIndex": 1.8,
-                "temperature": 22.5,
-                "humidity": 45.0,
-                "pm25": 12.3,
-                "tvoc": 150.0,
-                "co2": 800,
-                "co": 0.5,
-                "airPressure": 1013.25,
-                "ozone": 0.02,
-                "no2": 0.01,
-                "pm1": 5.6,
-                "pm4": 8.9,
-                "pm10": 15.2,
-                "ch2o": 0.03,
-                "light": 300,
-                "sound": 40,
-                "h2s": 0.001,
-                "no": 0.005,
-                "so2": 0.002,
-                "nh3": 0.008,
-                "oxygen": 20.9,
-                "timestamp": 1704067200,
-            },
-            {
-                "virusIndex": 2.6,
-                "moldIndex": 1.9,
-                "temperature": 22.6,
-                "humidity": 45.5,
-                "pm25": 12.5,
-                "tvoc": 155.0,
-                "co2": 810,
-                "co": 0.6,
-                "airPressure": 1013.30,
-                "ozone": 0.021,
-                "no2": 0.011,
-                "pm1": 5.7,
-                "pm4": 9.0,
-                "pm10": 15.5,
-                "ch2o": 0.031,
-                "light": 310,
-                "sound": 42,
-                "h2s": 0.0011,
-                "no": 0.0051,
-                "so2": 0.0021,
-                "nh3": 0.0081,
-                "oxygen": 20.91,
-                "timestamp": 1704067260,
-            },
-        ],
-        "usersettings": {
-            "temperature": "°C",
-            "temp": "c",
-            "humidity": "%",
-            "pm25": "µg/m^3",
-            "dust": "µg/m^3",
-            "tvoc": "ppb",
-            "voc": "ppb",
-            "co2": "ppm",
-            "co": "ppm",
-            "airPressure": "mbar",
-            "ozone": "ppb",
-            "no2": "ppb",
-        },
-    }
+def client_factory(monkeypatch, mock_websession):
+    """Factory returning a fresh Client wired to a fresh FakeAPI.
+
+    monkeypatch.setattr is a plain attribute swap, far cheaper than the
+    mock.patch enter/exit machinery the client tests used to run per test.
+    """
+
+    def _factory(**kwargs):
+        fake_api = FakeAPI()
+        monkeypatch.setattr("uhooapi.client.API", lambda websession: fake_api)
+        client = Client(api_key="test-api-key", websession=mock_websession, **kwargs)
+        return client, fake_api
+
+    return _factory
 
 
 @pytest.fixture
-def sample_token_response():
-    """Sample token response from API."""
-    return {
-        "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
-        "refresh_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
-        "token_type": "Bearer",
-        "expires_in": 3600,
-    }
+def make_mock_response(mock_websession):
+    """Factory that builds a mocked response and wires it into the session.
+
+    Replaces the response/context-manager boilerplate each request test used
+    to hand-roll; returns the response mock so tests can tweak it further.
+    """
+
+    def _factory(
+        status=200,
+        content_type="application/json",
+        json_body=None,
+        text_body=None,
+        raise_exc=None,
+    ):
+        mock_websession.request.reset_mock()
+
+        # MagicMock as the base: only json/text are awaited, so only those
+        # need the heavier AsyncMock machinery.
+        response = MagicMock()
+        response.status = status
+        response.content_type = content_type
+        response.json = AsyncMock(return_value=json_body)
+        response.text = AsyncMock(return_value=text_body)
+        response.raise_for_status = MagicMock(side_effect=raise_exc)
+
+        context_manager = MagicMock()
+        context_manager.__aenter__ = AsyncMock(return_value=response)
+        context_manager.__aexit__ = AsyncMock(return_value=None)
+        mock_websession.request.return_value = context_manager
+        return response
+
+    return _factory
+
+
+@pytest.fixture(scope="session")
+def assert_sensors():
+    """Helper comparing several device attributes in one batched assert."""
+
+    def _assert_sensors(device, **expected):
+        actual = operator.attrgetter(*expected)(device)
+        if len(expected) == 1:
+            actual = (actual,)
+        assert actual == tuple(expected.values())
+
+    return _assert_sensors
+
+
+@pytest.fixture(scope="session")
+def default_device_snapshot():
+    """Attribute snapshot of a freshly constructed Device({})."""
+    return dict(vars(Device({})))
 
 
 @pytest.fixture
+def fresh_device(default_device_snapshot):
+    """A default Device cloned from the snapshot, bypassing __init__.
+
+    Copying the attribute dict is much cheaper than re-running the
+    initializer, which sets 25+ sensor fields.
+    """
+    device = Device.__new__(Device)
+    device.__dict__.update(default_device_snapshot)
+    return device
+
+
+@pytest.fixture(scope="session")
+def sample_device_data():
+    """Sample device data from API (frozen; tests only read it)."""
+    return _SAMPLE_DEVICE_DATA
+
+
+@pytest.fixture(scope="session")
+def sample_sensor_data():
+    """Sample sensor data from API (frozen; tests only read it)."""
+    return _SAMPLE_SENSOR_DATA
+
+
+@pytest.fixture(scope="session")
+def sample_token_response():
+    """Sample token response from API (frozen; tests only read it)."""
+    return _SAMPLE_TOKEN_RESPONSE
+
+
+@pytest.fixture(scope="session")
 def sample_device_list():
-    """Sample device list from API."""
-    return [
-        {
-            "deviceName": "Living Room",
-            "macAddress": "AA:BB:CC:DD:EE:FF",
-            "serialNumber": "UHOO12345",
-            "floorNumber": 1,
-            "roomName": "Living Room",
-            "timezone": "America/New_York",
-            "utcOffset": "-05:00",
-            "ssid": "HomeWiFi",
-        },
-        {
-            "deviceName": "Bedroom",
-            "macAddress": "FF:EE:DD:CC:BB:AA",
-            "serialNumber": "UHOO67890",
-            "floorNumber": 2,
-            "roomName": "Master Bedroom",
-            "timezone": "America/New_York",
-            "utcOffset": "-05:00",
-            "ssid": "HomeWiFi",
-        },
-    ]
+    """Sample device list from API (frozen; tests only read it)."""
+    return _SAMPLE_DEVICE_LIST
@@ -0,0 +1,5 @@
+import os
+
+# Skip collecting the integration modules entirely when no API key is set;
+# a skipif marker would still import them on every run.
+collect_ignore_glob = [] if os.getenv("UHOO_API_KEY") else ["test_*.py"]
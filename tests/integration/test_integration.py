@@ -4,10 +4,6 @@ import os
 
 
 @pytest.mark.integration
-@pytest.mark.skipif(
-    not os.getenv("UHOO_API_KEY"),
-    reason="Integration tests require UHOO_API_KEY environment variable",
-)
 class TestIntegration:
     """Integration tests with real API (use sparingly)."""
 
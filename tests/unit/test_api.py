@@ -1,14 +1,87 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from unittest.mock import AsyncMock, Mock, call, patch
 from aiohttp import ClientResponseError, ClientError
+from aiohttp.client import RequestInfo
 from uhooapi.api import API
 from uhooapi.errors import UnauthorizedError, ForbiddenError, RequestError
 
+# Shared raise_for_status side effects, built once instead of per test.
+_UNAUTHORIZED_ERR = ClientResponseError(
+    request_info=None, history=None, status=401, message="Unauthorized"
+)
+_FORBIDDEN_ERR = ClientResponseError(
+    request_info=None, history=None, status=403, message="Forbidden"
+)
+_REQUEST_INFO = Mock(spec=RequestInfo)
+_REQUEST_INFO.real_url = "https://api.example.com/test"
+_SERVER_ERR = ClientResponseError(_REQUEST_INFO, (), status=500, message="Server Error")
+
+# (response kwargs, bearer token, POST data, expected result, expected error)
+_REQUEST_CASES = [
+    pytest.param(
+        {"json_body": {"success": True}, "text_body": '{"success": true}'},
+        None,
+        None,
+        {"success": True},
+        None,
+        id="success-json",
+    ),
+    pytest.param(
+        {"json_body": {"success": True}},
+        "test-token",
+        None,
+        {"success": True},
+        None,
+        id="bearer-token",
+    ),
+    pytest.param(
+        {"json_body": {"success": True}},
+        None,
+        {"test": "data"},
+        {"success": True},
+        None,
+        id="post-data",
+    ),
+    pytest.param(
+        {
+            "status": 401,
+            "json_body": {"error": "Unauthorized"},
+            "text_body": '{"error": "Unauthorized"}',
+            "raise_exc": _UNAUTHORIZED_ERR,
+        },
+        None,
+        None,
+        None,
+        UnauthorizedError,
+        id="unauthorized",
+    ),
+    pytest.param(
+        {
+            "status": 403,
+            "content_type": "text/plain",
+            "text_body": "Forbidden",
+            "raise_exc": _FORBIDDEN_ERR,
+        },
+        None,
+        None,
+        None,
+        ForbiddenError,
+        id="forbidden",
+    ),
+    pytest.param(
+        {"status": 500, "json_body": {"error": "Server Error"}, "raise_exc": _SERVER_ERR},
+        None,
+        None,
+        None,
+        RequestError,
+        id="server-error",
+    ),
+]
+
 
 class TestAPIInitialization:
     """Test API class initialization."""
 
-    @pytest.mark.asyncio
     async def test_api_init(self, mock_websession):
         """Test API initialization."""
         api = API(mock_websession)
@@ -21,178 +94,48 @@ class TestAPIInitialization:
 class TestAPIRequest:
     """Test API _request method."""
 
-    @pytest.mark.asyncio
-    async def test_request_success_json(self, mock_websession):
-        """Test successful JSON request."""
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.content_type = "application/json"
-        mock_response.json = AsyncMock(return_value={"success": True})
-        mock_response.raise_for_status = MagicMock()
-        mock_response.text = AsyncMock(return_value='{"success": true}')
-
-        # Mock the async context manager protocol
-        mock_context_manager = AsyncMock()
-        mock_context_manager.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_context_manager.__aexit__ = AsyncMock(return_value=None)
-
-        mock_websession.request.return_value = mock_context_manager
-
-        api = API(mock_websession)
-        result = await api._request("GET", "https://api.example.com", "test")
-
-        assert result == {"success": True}
-        mock_websession.request.assert_called_once_with(
-            "GET", "https://api.example.com/test", headers={}, data=None
-        )
-
-    @pytest.mark.asyncio
-    async def test_request_with_bearer_token(self, mock_websession):
-        """Test request with bearer token."""
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.content_type = "application/json"
-        mock_response.json = AsyncMock(return_value={"success": True})
-        mock_response.raise_for_status = MagicMock()
-
-        mock_context_manager = AsyncMock()
-        mock_context_manager.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_context_manager.__aexit__ = AsyncMock(return_value=None)
-
-        mock_websession.request.return_value = mock_context_manager
+    @pytest.mark.parametrize(
+        "response_kwargs, bearer_token, data, expected, raises", _REQUEST_CASES
+    )
+    async def test_request(
+        self,
+        mock_websession,
+        make_mock_response,
+        response_kwargs,
+        bearer_token,
+        data,
+        expected,
+        raises,
+    ):
+        """Test _request across success, auth, and error responses."""
+        make_mock_response(**response_kwargs)
 
         api = API(mock_websession)
-        api.set_bearer_token("test-token")
-        await api._request("GET", "https://api.example.com", "test")
-
-        mock_websession.request.assert_called_once_with(
-            "GET",
-            "https://api.example.com/test",
-            headers={"Authorization": "Bearer test-token"},
-            data=None,
-        )
-
-    @pytest.mark.asyncio
-    async def test_request_with_data(self, mock_websession):
-        """Test request with POST data."""
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.content_type = "application/json"
-        mock_response.json = AsyncMock(return_value={"success": True})
-        mock_response.raise_for_status = MagicMock()
-
-        mock_context_manager = AsyncMock()
-        mock_context_manager.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_context_manager.__aexit__ = AsyncMock(return_value=None)
+        if bearer_token is not None:
+            api.set_bearer_token(bearer_token)
+        method = "POST" if data is not None else "GET"
 
-        mock_websession.request.return_value = mock_context_manager
+        if raises is not None:
+            with pytest.raises(raises):
+                await api._request(method, "https://api.example.com", "test", data=data)
+            return
 
-        api = API(mock_websession)
-        data = {"test": "data"}
-        await api._request("POST", "https://api.example.com", "test", data=data)
+        result = await api._request(method, "https://api.example.com", "test", data=data)
 
-        mock_websession.request.assert_called_once_with(
-            "POST", "https://api.example.com/test", headers={}, data={"test": "data"}
+        assert result == expected
+        headers = (
+            {"Authorization": f"Bearer {bearer_token}"} if bearer_token else {}
         )
-
-    @pytest.mark.asyncio
-    async def test_request_unauthorized(self, mock_websession):
-        """Test request with 401 Unauthorized."""
-        mock_response = AsyncMock()
-        mock_response.status = 401
-        mock_response.content_type = "application/json"
-        mock_response.json = AsyncMock(return_value={"error": "Unauthorized"})
-        mock_response.raise_for_status = MagicMock(
-            side_effect=ClientResponseError(
-                request_info=None, history=None, status=401, message="Unauthorized"
-            )
+        assert mock_websession.request.call_count == 1
+        assert mock_websession.request.call_args == call(
+            method, "https://api.example.com/test", headers=headers, data=data
         )
-        mock_response.text = AsyncMock(return_value='{"error": "Unauthorized"}')
-
-        mock_context_manager = AsyncMock()
-        mock_context_manager.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_context_manager.__aexit__ = AsyncMock(return_value=None)
-
-        mock_websession.request.return_value = mock_context_manager
-
-        api = API(mock_websession)
-
-        with pytest.raises(UnauthorizedError):
-            await api._request("GET", "https://api.example.com", "test")
 
-    @pytest.mark.asyncio
-    async def test_request_forbidden(self, mock_websession):
-        """Test request with 403 Forbidden."""
-        mock_response = AsyncMock()
-        mock_response.status = 403
-        mock_response.content_type = "text/plain"
-        mock_response.text = AsyncMock(return_value="Forbidden")
-        mock_response.raise_for_status = MagicMock(
-            side_effect=ClientResponseError(
-                request_info=None, history=None, status=403, message="Forbidden"
-            )
-        )
-
-        mock_context_manager = AsyncMock()
-        mock_context_manager.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_context_manager.__aexit__ = AsyncMock(return_value=None)
-
-        mock_websession.request.return_value = mock_context_manager
-
-        api = API(mock_websession)
-
-        with pytest.raises(ForbiddenError):
-            await api._request("GET", "https://api.example.com", "test")
-
-    @pytest.mark.asyncio
-    async def test_request_other_error(self, mock_websession):
-        """Test request with other HTTP error."""
-        # Import here to avoid circular imports
-        from aiohttp.client import RequestInfo
-
-        # Create a proper RequestInfo mock
-        mock_request_info = Mock(spec=RequestInfo)
-        mock_request_info.real_url = "https://api.example.com/test"
-
-        mock_response = AsyncMock()
-        mock_response.status = 500
-        mock_response.content_type = "application/json"
-        mock_response.json = AsyncMock(return_value={"error": "Server Error"})
-
-        # Create the ClientResponseError properly
-        client_response_error = ClientResponseError(
-            mock_request_info, (), status=500, message="Server Error"
-        )
-        mock_response.raise_for_status = MagicMock(side_effect=client_response_error)
-
-        mock_websession.request.return_value.__aenter__ = AsyncMock(
-            return_value=mock_response
-        )
-        mock_websession.request.return_value.__aexit__ = AsyncMock(return_value=None)
-
-        api = API(mock_websession)
-
-        with pytest.raises(RequestError, match="Error requesting data"):
-            await api._request("GET", "https://api.example.com", "test")
-
-    @pytest.mark.asyncio
-    async def test_request_client_error(self, mock_websession):
+    async def test_request_client_error(self, mock_websession, make_mock_response):
         """Test request with client error (e.g., network issue)."""
-        # Create a mock response
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.content_type = "application/json"
+        mock_response = make_mock_response(text_body="")
         # Make json() raise ClientError
         mock_response.json = AsyncMock(side_effect=ClientError("Network error"))
-        mock_response.raise_for_status = AsyncMock()  # This won't be reached
-        mock_response.text = AsyncMock(return_value="")
-
-        # Create a context manager
-        mock_context_manager = AsyncMock()
-        mock_context_manager.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_context_manager.__aexit__ = AsyncMock(return_value=None)
-
-        mock_websession.request.return_value = mock_context_manager
 
         api = API(mock_websession)
 
@@ -203,7 +146,6 @@ class TestAPIRequest:
 class TestAPIMethods:
     """Test API public methods."""
 
-    @pytest.mark.asyncio
     async def test_generate_token(self, mock_websession):
         """Test generate_token method."""
         mock_response = {"access_token": "test-token"}
@@ -214,7 +156,8 @@ class TestAPIMethods:
             api = API(mock_websession)
             result = await api.generate_token("test-code")
 
-            mock_request.assert_called_once_with(
+            assert mock_request.call_count == 1
+            assert mock_request.call_args == call(
                 "post",
                 "https://api.uhooinc.com/integration",
                 "generatetoken",
@@ -222,7 +165,6 @@ class TestAPIMethods:
             )
             assert result == mock_response
 
-    @pytest.mark.asyncio
     async def test_get_device_data(self, mock_websession):
         """Test get_device_data method."""
         mock_response = {"data": []}
@@ -233,7 +175,8 @@ class TestAPIMethods:
             api = API(mock_websession)
             result = await api.get_device_data("UHOO12345", "minute", 5)
 
-            mock_request.assert_called_once_with(
+            assert mock_request.call_count == 1
+            assert mock_request.call_args == call(
                 "post",
                 "https://api.uhooinc.com/integration",
                 "getdata",
@@ -241,7 +184,6 @@ class TestAPIMethods:
             )
             assert result == mock_response
 
-    @pytest.mark.asyncio
     async def test_get_device_list(self, mock_websession):
         """Test get_device_list method."""
         mock_response = []
@@ -252,7 +194,8 @@ class TestAPIMethods:
             api = API(mock_websession)
             result = await api.get_device_list()
 
-            mock_request.assert_called_once_with(
+            assert mock_request.call_count == 1
+            assert mock_request.call_args == call(
                 "post", "https://api.uhooinc.com/integration", "getdeviceslist"
             )
             assert result == mock_response
@@ -1,14 +1,14 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock
 import logging
 from uhooapi.client import Client
+from uhooapi.device import Device
 from uhooapi.errors import UnauthorizedError, ForbiddenError
 
 
 class TestClientInitialization:
     """Test Client initialization."""
 
-    @pytest.mark.asyncio
     async def test_client_init_defaults(self, mock_websession):
         """Test client initialization with defaults."""
         client = Client(api_key="test-api-key", websession=mock_websession)
@@ -25,7 +25,6 @@ class TestClientInitialization:
         # We'll just check that it's a logger
         assert hasattr(client._log, "level")
 
-    @pytest.mark.asyncio
     async def test_client_init_debug_mode(self, mock_websession):
         """Test client initialization with debug mode enabled."""
         client = Client(api_key="test-api-key", websession=mock_websession, debug=True)
@@ -33,7 +32,6 @@ class TestClientInitialization:
         # Check if debug mode sets the right level
         assert client._log.level == logging.DEBUG
 
-    @pytest.mark.asyncio
     async def test_client_init_custom_params(self, mock_websession):
         """Test client initialization with custom parameters."""
         Client(
@@ -58,332 +56,171 @@ class TestClientInitialization:
 class TestClientLogin:
     """Test Client login method."""
 
-    @pytest.mark.asyncio
-    async def test_login_success(self, mock_websession, sample_token_response):
+    async def test_login_success(self, client_factory, sample_token_response):
         """Test successful login."""
-        # Mock API response
-        mock_api = AsyncMock()
-        mock_api.generate_token.return_value = sample_token_response
-        mock_api.set_bearer_token = MagicMock()
+        client, fake_api = client_factory()
+        fake_api.returns["generate_token"] = sample_token_response
 
-        with patch("uhooapi.client.API", return_value=mock_api):
-            client = Client(api_key="test-api-key", websession=mock_websession)
-            await client.login()
+        await client.login()
 
-            # Verify API calls
-            mock_api.generate_token.assert_called_once_with("test-api-key")
-            mock_api.set_bearer_token.assert_called_once_with(
-                sample_token_response["access_token"]
-            )
+        # Verify API calls
+        assert fake_api.calls_to("generate_token") == [
+            ("generate_token", ("test-api-key",), {})
+        ]
+        assert fake_api.calls_to("set_bearer_token") == [
+            ("set_bearer_token", (sample_token_response["access_token"],), {})
+        ]
 
-            # Verify tokens are set
-            assert client._access_token == sample_token_response["access_token"]
-            assert client._refresh_token == sample_token_response["refresh_token"]
+        # Verify tokens are set
+        assert client._access_token == sample_token_response["access_token"]
+        assert client._refresh_token == sample_token_response["refresh_token"]
 
-    @pytest.mark.asyncio
-    async def test_login_no_token_returned(self, mock_websession):
+    async def test_login_no_token_returned(self, client_factory):
         """Test login when no token is returned."""
-        mock_api = AsyncMock()
-        mock_api.generate_token.return_value = None
-        mock_api.set_bearer_token = MagicMock()
+        client, fake_api = client_factory()
 
-        with patch("uhooapi.client.API", return_value=mock_api):
-            client = Client(api_key="test-api-key", websession=mock_websession)
-            await client.login()
+        await client.login()
 
-            mock_api.generate_token.assert_called_once_with("test-api-key")
-            mock_api.set_bearer_token.assert_called_once_with(None)
-            assert client._access_token is None
-            assert client._refresh_token is None
+        assert fake_api.calls_to("generate_token") == [
+            ("generate_token", ("test-api-key",), {})
+        ]
+        assert fake_api.calls_to("set_bearer_token") == [
+            ("set_bearer_token", (None,), {})
+        ]
+        assert client._access_token is None
+        assert client._refresh_token is None
 
-    @pytest.mark.asyncio
-    async def test_login_api_exception(self, mock_websession):
+    async def test_login_api_exception(self, client_factory):
         """Test login when API raises an exception."""
-        mock_api = AsyncMock()
-        mock_api.generate_token.side_effect = Exception("API Error")
+        client, fake_api = client_factory()
+        fake_api.side_effects["generate_token"] = [Exception("API Error")]
 
-        with patch("uhooapi.client.API", return_value=mock_api):
-            client = Client(api_key="test-api-key", websession=mock_websession)
-
-            with pytest.raises(Exception, match="API Error"):
-                await client.login()
+        with pytest.raises(Exception, match="API Error"):
+            await client.login()
 
 
 class TestClientSetupDevices:
     """Test Client setup_devices method."""
 
-    @pytest.mark.asyncio
-    async def test_setup_devices_success(self, mock_websession, sample_device_list):
+    async def test_setup_devices_success(self, client_factory, sample_device_list):
         """Test successful device setup."""
-        mock_api = AsyncMock()
-        mock_api.get_device_list.return_value = sample_device_list
-        mock_api.set_bearer_token = MagicMock()
+        client, fake_api = client_factory()
+        fake_api.returns["get_device_list"] = sample_device_list
+        client._access_token = "test-token"
 
-        with patch("uhooapi.client.API", return_value=mock_api):
-            client = Client(api_key="test-api-key", websession=mock_websession)
-            client._access_token = "test-token"
-            client._api.set_bearer_token = mock_api.set_bearer_token
+        await client.setup_devices()
 
-            await client.setup_devices()
+        # Verify devices are created
+        assert len(client.devices) == 2
+        assert "UHOO12345" in client.devices
+        assert "UHOO67890" in client.devices
 
-            # Verify devices are created
-            assert len(client.devices) == 2
-            assert "UHOO12345" in client.devices
-            assert "UHOO67890" in client.devices
-
-            # Verify device properties
-            device1 = client.devices["UHOO12345"]
-            assert device1.device_name == "Living Room"
-            assert device1.serial_number == "UHOO12345"
-            assert device1.mac_address == "AA:BB:CC:DD:EE:FF"
-
-            device2 = client.devices["UHOO67890"]
-            assert device2.device_name == "Bedroom"
-            assert device2.serial_number == "UHOO67890"
-
-    @pytest.mark.asyncio
-    async def test_setup_devices_empty_list(self, mock_websession):
-        """Test device setup with empty device list."""
-        mock_api = AsyncMock()
-        mock_api.get_device_list.return_value = []
-
-        with patch("uhooapi.client.API", return_value=mock_api):
-            client = Client(api_key="test-api-key", websession=mock_websession)
-            client._access_token = "test-token"
+        # Verify device properties
+        device1 = client.devices["UHOO12345"]
+        assert device1.device_name == "Living Room"
+        assert device1.serial_number == "UHOO12345"
+        assert device1.mac_address == "AA:BB:CC:DD:EE:FF"
 
-            await client.setup_devices()
+        device2 = client.devices["UHOO67890"]
+        assert device2.device_name == "Bedroom"
+        assert device2.serial_number == "UHOO67890"
 
-            assert client.devices == {}
+    @pytest.mark.parametrize("resp", [[], None], ids=["empty-list", "none"])
+    async def test_setup_devices_no_devices(self, client_factory, resp):
+        """Test device setup when the API returns an empty list or None."""
+        client, fake_api = client_factory()
+        fake_api.returns["get_device_list"] = resp
+        client._access_token = "test-token"
 
-    @pytest.mark.asyncio
-    async def test_setup_devices_none_response(self, mock_websession):
-        """Test device setup when API returns None."""
-        mock_api = AsyncMock()
-        mock_api.get_device_list.return_value = None
+        await client.setup_devices()
 
-        with patch("uhooapi.client.API", return_value=mock_api):
-            client = Client(api_key="test-api-key", websession=mock_websession)
-            client._access_token = "test-token"
-
-            await client.setup_devices()
-
-            assert client.devices == {}
-
-    @pytest.mark.asyncio
-    async def test_setup_devices_unauthorized_retry(
-        self, mock_websession, sample_device_list
-    ):
-        """Test device setup with unauthorized error and retry."""
-        mock_api = AsyncMock()
-        mock_api.get_device_list.side_effect = [
-            UnauthorizedError("Unauthorized"),
-            sample_device_list,
-        ]
-        mock_api.set_bearer_token = MagicMock()
-
-        with patch("uhooapi.client.API", return_value=mock_api):
-            client = Client(api_key="test-api-key", websession=mock_websession)
-            client._access_token = "test-token"
-            client._api.set_bearer_token = mock_api.set_bearer_token
-            client.login = AsyncMock()
-
-            await client.setup_devices()
-
-            # Verify login was called after unauthorized error
-            client.login.assert_called_once()
-            # Verify get_device_list was called twice
-            assert mock_api.get_device_list.call_count == 2
-            assert len(client.devices) == 2
-
-    @pytest.mark.asyncio
-    async def test_setup_devices_forbidden_retry(
-        self, mock_websession, sample_device_list
-    ):
-        """Test device setup with forbidden error and retry."""
-        mock_api = AsyncMock()
-        mock_api.get_device_list.side_effect = [
-            ForbiddenError("Forbidden"),
-            sample_device_list,
-        ]
-        mock_api.set_bearer_token = MagicMock()
-
-        with patch("uhooapi.client.API", return_value=mock_api):
-            client = Client(api_key="test-api-key", websession=mock_websession)
-            client._access_token = "test-token"
-            client._api.set_bearer_token = mock_api.set_bearer_token
-            client.login = AsyncMock()
-
-            await client.setup_devices()
-
-            client.login.assert_called_once()
-            assert mock_api.get_device_list.call_count == 2
-            assert len(client.devices) == 2
+        assert client.devices == {}
 
-    @pytest.mark.asyncio
-    async def test_setup_devices_duplicate_serial_number(self, mock_websession):
+    async def test_setup_devices_duplicate_serial_number(self, client_factory):
         """Test device setup with duplicate serial numbers."""
         duplicate_list = [
             {"serialNumber": "UHOO12345", "deviceName": "Device 1"},
             {"serialNumber": "UHOO12345", "deviceName": "Device 2"},  # Same serial
         ]
 
-        mock_api = AsyncMock()
-        mock_api.get_device_list.return_value = duplicate_list
-
-        with patch("uhooapi.client.API", return_value=mock_api):
-            client = Client(api_key="test-api-key", websession=mock_websession)
-            client._access_token = "test-token"
+        client, fake_api = client_factory()
+        fake_api.returns["get_device_list"] = duplicate_list
+        client._access_token = "test-token"
 
-            await client.setup_devices()
+        await client.setup_devices()
 
-            # Only one device should be created (first one wins)
-            assert len(client.devices) == 1
-            assert client.devices["UHOO12345"].device_name == "Device 1"
+        # Only one device should be created (first one wins)
+        assert len(client.devices) == 1
+        assert client.devices["UHOO12345"].device_name == "Device 1"
 
 
 class TestClientGetLatestData:
     """Test Client get_latest_data method."""
 
-    @pytest.mark.asyncio
     async def test_get_latest_data_success(
-        self, mock_websession, sample_sensor_data, sample_device_data
+        self, client_factory, sample_sensor_data, sample_device_data, assert_sensors
     ):
         """Test successful get_latest_data call."""
-        mock_api = AsyncMock()
-        mock_api.get_device_data.return_value = sample_sensor_data
-
-        with patch("uhooapi.client.API", return_value=mock_api):
-            client = Client(api_key="test-api-key", websession=mock_websession)
-            client._access_token = "test-token"
-
-            # Setup a device first
-            from uhooapi.device import Device
+        client, fake_api = client_factory()
+        fake_api.returns["get_device_data"] = sample_sensor_data
+        client._access_token = "test-token"
 
-            device = Device(sample_device_data)
-            client.devices["UHOO12345"] = device
+        # Setup a device first
+        device = Device(sample_device_data)
+        client.devices["UHOO12345"] = device
 
-            await client.get_latest_data("UHOO12345")
+        await client.get_latest_data("UHOO12345")
 
-            # Verify API call
-            mock_api.get_device_data.assert_called_once_with("UHOO12345", "minute", 5)
-
-            # Verify device data was updated
-            device = client.devices["UHOO12345"]
-            # Check averages (should be average of two data points, rounded to 1 decimal)
-            # (22.5 + 22.6) / 2 = 22.55, rounded to 22.6 (banker's rounding)
-            assert device.temperature == 22.6
-            # (45.0 + 45.5) / 2 = 45.25, rounded to 45.2 (banker's rounding)
-            assert device.humidity == 45.2
-            assert device.co2 == 805.0  # (800 + 810) / 2 = 805
-            assert device.timestamp == 1704067260  # Latest timestamp
-
-    @pytest.mark.asyncio
-    async def test_get_latest_data_unauthorized_retry(
-        self, mock_websession, sample_sensor_data, sample_device_data
-    ):
-        """Test get_latest_data with unauthorized error and retry."""
-        mock_api = AsyncMock()
-        mock_api.get_device_data.side_effect = [
-            UnauthorizedError("Unauthorized"),
-            sample_sensor_data,
+        # Verify API call
+        assert fake_api.calls_to("get_device_data") == [
+            ("get_device_data", ("UHOO12345", "minute", 5), {})
         ]
 
-        with patch("uhooapi.client.API", return_value=mock_api):
-            client = Client(api_key="test-api-key", websession=mock_websession)
-            client._access_token = "test-token"
-            client.login = AsyncMock()
-
-            # Setup a device
-            from uhooapi.device import Device
-
-            device = Device(sample_device_data)
-            client.devices["UHOO12345"] = device
-
-            await client.get_latest_data("UHOO12345")
-
-            # Verify retry logic
-            client.login.assert_called_once()
-            assert mock_api.get_device_data.call_count == 2
-
-            # Verify device was updated (rounded to 1 decimal)
-            device = client.devices["UHOO12345"]
-            # (22.5 + 22.6) / 2 = 22.55, rounded to 22.6
-            assert device.temperature == 22.6
+        # Verify device data was updated: averages of the two data points
+        # rounded to 1 decimal (banker's rounding), plus the latest timestamp
+        device = client.devices["UHOO12345"]
+        assert_sensors(
+            device,
+            temperature=22.6,
+            humidity=45.2,
+            co2=805.0,
+            timestamp=1704067260,
+        )
 
-    @pytest.mark.asyncio
-    async def test_get_latest_data_forbidden_retry(
-        self, mock_websession, sample_sensor_data, sample_device_data
+    async def test_get_latest_data_device_not_found(
+        self, client_factory, sample_sensor_data
     ):
-        """Test get_latest_data with forbidden error and retry."""
-        mock_api = AsyncMock()
-        mock_api.get_device_data.side_effect = [
-            ForbiddenError("Forbidden"),
-            sample_sensor_data,
-        ]
-
-        with patch("uhooapi.client.API", return_value=mock_api):
-            client = Client(api_key="test-api-key", websession=mock_websession)
-            client._access_token = "test-token"
-            client.login = AsyncMock()
-
-            # Setup a device
-            from uhooapi.device import Device
-
-            device = Device(sample_device_data)
-            client.devices["UHOO12345"] = device
-
-            await client.get_latest_data("UHOO12345")
-
-            client.login.assert_called_once()
-            assert mock_api.get_device_data.call_count == 2
-
-    @pytest.mark.asyncio
-    async def test_get_latest_data_device_not_found(self, mock_websession, caplog):
         """Test get_latest_data for a device that doesn't exist."""
-        mock_api = AsyncMock()
+        client, fake_api = client_factory()
+        fake_api.returns["get_device_data"] = sample_sensor_data
 
-        with patch("uhooapi.client.API", return_value=mock_api):
-            client = Client(
-                api_key="test-api-key", websession=mock_websession, debug=True
-            )
+        # The device was never set up, so the lookup raises KeyError after
+        # logging the missing-serial error
+        with pytest.raises(KeyError, match="NONEXISTENT"):
+            await client.get_latest_data("NONEXISTENT")
 
-            # The actual code will raise a KeyError when trying to access
-            # self.devices["NONEXISTENT"] since the device doesn't exist
-            with pytest.raises(KeyError, match="NONEXISTENT"):
-                await client.get_latest_data("NONEXISTENT")
-
-    @pytest.mark.asyncio
-    async def test_get_latest_data_none_response(
-        self, mock_websession, sample_device_data
-    ):
+    async def test_get_latest_data_none_response(self, client_factory, fresh_device):
         """Test get_latest_data when API returns None."""
-        mock_api = AsyncMock()
-        mock_api.get_device_data.return_value = None
+        client, fake_api = client_factory()
+        fake_api.returns["get_device_data"] = None
 
-        with patch("uhooapi.client.API", return_value=mock_api):
-            client = Client(api_key="test-api-key", websession=mock_websession)
+        # Setup a device
+        client.devices["UHOO12345"] = fresh_device
 
-            # Setup a device
-            from uhooapi.device import Device
+        # Store initial values
+        initial_temp = fresh_device.temperature
 
-            device = Device(sample_device_data)
-            client.devices["UHOO12345"] = device
+        await client.get_latest_data("UHOO12345")
 
-            # The actual code will have UnboundLocalError because:
-            # 1. data_latest is None
-            # 2. The condition `if data_latest is not None:` is false
-            # 3. So `data` is never defined
-            # 4. Then `device_obj.update_data(data)` tries to use undefined `data`
-            with pytest.raises(UnboundLocalError):
-                await client.get_latest_data("UHOO12345")
+        # Device data should remain unchanged
+        assert fresh_device.temperature == initial_temp
 
-    @pytest.mark.asyncio
     async def test_get_latest_data_empty_data_points(
-        self, mock_websession, sample_device_data
+        self, client_factory, sample_device_data
     ):
         """Test get_latest_data with empty data points."""
-        mock_api = AsyncMock()
-        mock_api.get_device_data.return_value = {
+        client, fake_api = client_factory()
+        fake_api.returns["get_device_data"] = {
             "data": [],
             "usersettings": {
                 "temperature": "°C",
@@ -401,95 +238,133 @@ class TestClientGetLatestData:
             },
         }
 
-        with patch("uhooapi.client.API", return_value=mock_api):
-            client = Client(api_key="test-api-key", websession=mock_websession)
-
-            # Setup a device
-            from uhooapi.device import Device
-
-            device = Device(sample_device_data)
-            client.devices["UHOO12345"] = device
+        # Setup a device
+        device = Device(sample_device_data)
+        client.devices["UHOO12345"] = device
+
+        # Store initial values
+        initial_temp = device.temperature
+
+        await client.get_latest_data("UHOO12345")
+
+        # Device data should remain unchanged
+        assert device.temperature == initial_temp
+
+
+class TestClientAuthRetry:
+    """Test the shared auth-error retry path across client methods."""
+
+    @pytest.mark.parametrize("err_cls", [UnauthorizedError, ForbiddenError])
+    @pytest.mark.parametrize(
+        "api_method, payload_fixture, call",
+        [
+            pytest.param(
+                "get_device_list",
+                "sample_device_list",
+                lambda client: client.setup_devices(),
+                id="setup_devices",
+            ),
+            pytest.param(
+                "get_device_data",
+                "sample_sensor_data",
+                lambda client: client.get_latest_data("UHOO12345"),
+                id="get_latest_data",
+            ),
+        ],
+    )
+    async def test_auth_retry(
+        self,
+        request,
+        client_factory,
+        sample_device_data,
+        api_method,
+        payload_fixture,
+        call,
+        err_cls,
+    ):
+        """An auth error triggers exactly one re-login and one retried call."""
+        client, fake_api = client_factory()
+        fake_api.side_effects[api_method] = [
+            err_cls("denied"),
+            request.getfixturevalue(payload_fixture),
+        ]
+        client._access_token = "test-token"
+        client.login = AsyncMock()
+        client.devices["UHOO12345"] = Device(sample_device_data)
 
-            # Store initial values
-            initial_temp = device.temperature
+        await call(client)
 
-            await client.get_latest_data("UHOO12345")
+        # Verify login was called after the auth error and the call retried
+        assert client.login.call_count == 1
+        assert len(fake_api.calls_to(api_method)) == 2
 
-            # Device data should remain unchanged
-            assert device.temperature == initial_temp
+        if api_method == "get_device_list":
+            # The retried setup added the second device from the list
+            assert len(client.devices) == 2
+        else:
+            # (22.5 + 22.6) / 2 = 22.55, rounded to 22.6
+            assert client.devices["UHOO12345"].temperature == 22.6
 
 
 class TestClientGetDevices:
     """Test Client get_devices method."""
 
-    @pytest.mark.asyncio
-    async def test_get_devices_empty(self, mock_websession):
-        """Test get_devices with no devices."""
-        client = Client(api_key="test-api-key", websession=mock_websession)
-
-        devices = client.get_devices()
-        assert devices == {}
-
-    @pytest.mark.asyncio
-    async def test_get_devices_with_devices(self, mock_websession, sample_device_data):
-        """Test get_devices with populated devices."""
+    @pytest.mark.parametrize(
+        "serials", [(), ("UHOO12345", "UHOO67890")], ids=["empty", "populated"]
+    )
+    async def test_get_devices(self, mock_websession, sample_device_data, serials):
+        """Test get_devices with and without devices."""
         client = Client(api_key="test-api-key", websession=mock_websession)
 
         # Add devices directly
-        from uhooapi.device import Device
-
-        device1 = Device(sample_device_data)
-        device2 = Device({**sample_device_data, "serialNumber": "UHOO67890"})
-
-        client.devices = {"UHOO12345": device1, "UHOO67890": device2}
+        expected = {
+            serial: Device({**sample_device_data, "serialNumber": serial})
+            for serial in serials
+        }
+        client.devices = dict(expected)
 
         devices = client.get_devices()
-        assert len(devices) == 2
-        assert "UHOO12345" in devices
-        assert "UHOO67890" in devices
-        assert devices["UHOO12345"] is device1
-        assert devices["UHOO67890"] is device2
+        assert len(devices) == len(serials)
+        for serial in serials:
+            assert devices[serial] is expected[serial]
 
 
 class TestClientIntegration:
     """Test Client integration scenarios."""
 
-    @pytest.mark.asyncio
     async def test_full_workflow(
         self,
-        mock_websession,
+        client_factory,
         sample_token_response,
         sample_device_list,
         sample_sensor_data,
     ):
         """Test complete workflow: login -> setup devices -> get data."""
-        mock_api = AsyncMock()
-        mock_api.generate_token.return_value = sample_token_response
-        mock_api.get_device_list.return_value = sample_device_list
-        mock_api.get_device_data.return_value = sample_sensor_data
-        mock_api.set_bearer_token = MagicMock()
-
-        with patch("uhooapi.client.API", return_value=mock_api):
-            client = Client(api_key="test-api-key", websession=mock_websession)
-
-            # 1. Login
-            await client.login()
-            assert client._access_token == sample_token_response["access_token"]
-
-            # 2. Setup devices
-            await client.setup_devices()
-            assert len(client.devices) == 2
-            assert "UHOO12345" in client.devices
-            assert "UHOO67890" in client.devices
-
-            # 3. Get latest data for a device
-            await client.get_latest_data("UHOO12345")
-            device = client.devices["UHOO12345"]
-            # Temperature should be rounded to 1 decimal place
-            # (22.5 + 22.6) / 2 = 22.55, rounded to 22.6
-            assert device.temperature == 22.6
-
-            # Verify all API calls were made
-            mock_api.generate_token.assert_called_once()
-            mock_api.get_device_list.assert_called_once()
-            mock_api.get_device_data.assert_called_once_with("UHOO12345", "minute", 5)
+        client, fake_api = client_factory()
+        fake_api.returns["generate_token"] = sample_token_response
+        fake_api.returns["get_device_list"] = sample_device_list
+        fake_api.returns["get_device_data"] = sample_sensor_data
+
+        # 1. Login
+        await client.login()
+        assert client._access_token == sample_token_response["access_token"]
+
+        # 2. Setup devices
+        await client.setup_devices()
+        assert len(client.devices) == 2
+        assert "UHOO12345" in client.devices
+        assert "UHOO67890" in client.devices
+
+        # 3. Get latest data for a device
+        await client.get_latest_data("UHOO12345")
+        device = client.devices["UHOO12345"]
+        # Temperature should be rounded to 1 decimal place
+        # (22.5 + 22.6) / 2 = 22.55, rounded to 22.6
+        assert device.temperature == 22.6
+
+        # Verify all API calls were made
+        assert len(fake_api.calls_to("generate_token")) == 1
+        assert len(fake_api.calls_to("get_device_list")) == 1
+        assert fake_api.calls_to("get_device_data") == [
+            ("get_device_data", ("UHOO12345", "minute", 5), {})
+        ]
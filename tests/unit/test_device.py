@@ -1,5 +1,14 @@
+import pytest
+import re
 from uhooapi.device import Device
 
+# Expected snake_case attribute per sensor field, computed once at import
+# instead of calling the regex-backed _to_attr_name per field per test.
+_SNAKE_RE = re.compile(r"(?<!^)(?=[A-Z])")
+_ATTR_NAMES = {
+    field: _SNAKE_RE.sub("_", field).lower() for field in Device.SENSOR_FIELDS
+}
+
 _USER_SETTINGS = {
     "temperature": "°C",
     "temp": "c",
@@ -19,58 +28,69 @@ _USER_SETTINGS = {
 class TestDeviceInitialization:
     """Test Device class initialization."""
 
-    def test_device_init_empty(self):
-        """Test device initialization with empty dict."""
-        device = Device({})
-
-        # Default values
-        assert device.device_name == ""
-        assert device.mac_address == ""
-        assert device.serial_number == ""
-        assert device.floor_number == 0
-        assert device.room_name == ""
-        assert device.timezone == ""
-        assert device.utc_offset == ""
-        assert device.ssid == ""
-
-        # Sensor fields should be initialized to 0.0
-        assert device.virus_index == 0.0
-        assert device.mold_index == 0.0
-        assert device.temperature == 0.0
-        assert device.humidity == 0.0
-        assert device.timestamp == -1
-
-    def test_device_init_with_data(self):
-        """Test device initialization with data."""
-        device_data = {
-            "deviceName": "Living Room",
-            "macAddress": "AA:BB:CC:DD:EE:FF",
-            "serialNumber": "UHOO12345",
-            "floorNumber": 1,
-            "roomName": "Living Room",
-            "timezone": "America/New_York",
-            "utcOffset": "-05:00",
-            "ssid": "HomeWiFi",
-        }
-
+    @pytest.mark.parametrize(
+        "device_data, expected",
+        [
+            pytest.param(
+                {},
+                {
+                    # Default values
+                    "device_name": "",
+                    "mac_address": "",
+                    "serial_number": "",
+                    "floor_number": 0,
+                    "room_name": "",
+                    "timezone": "",
+                    "utc_offset": "",
+                    "ssid": "",
+                    # Sensor fields should be initialized to 0.0
+                    "virus_index": 0.0,
+                    "mold_index": 0.0,
+                    "temperature": 0.0,
+                    "humidity": 0.0,
+                    "timestamp": -1,
+                },
+                id="empty",
+            ),
+            pytest.param(
+                {
+                    "deviceName": "Living Room",
+                    "macAddress": "AA:BB:CC:DD:EE:FF",
+                    "serialNumber": "UHOO12345",
+                    "floorNumber": 1,
+                    "roomName": "Living Room",
+                    "timezone": "America/New_York",
+                    "utcOffset": "-05:00",
+                    "ssid": "HomeWiFi",
+                },
+                {
+                    "device_name": "Living Room",
+                    "mac_address": "AA:BB:CC:DD:EE:FF",
+                    "serial_number": "UHOO12345",
+                    "floor_number": 1,
+                    "room_name": "Living Room",
+                    "timezone": "America/New_York",
+                    "utc_offset": "-05:00",
+                    "ssid": "HomeWiFi",
+                },
+                id="with-data",
+            ),
+        ],
+    )
+    def test_device_init(self, device_data, expected):
+        """Test device initialization with and without data."""
         device = Device(device_data)
 
-        assert device.device_name == "Living Room"
-        assert device.mac_address == "AA:BB:CC:DD:EE:FF"
-        assert device.serial_number == "UHOO12345"
-        assert device.floor_number == 1
-        assert device.room_name == "Living Room"
-        assert device.timezone == "America/New_York"
-        assert device.utc_offset == "-05:00"
-        assert device.ssid == "HomeWiFi"
+        for attr, value in expected.items():
+            assert getattr(device, attr) == value
 
 
 class TestDeviceUpdate:
     """Test device update methods."""
 
-    def test_update_device(self):
+    def test_update_device(self, fresh_device):
         """Test update_device method."""
-        device = Device({})
+        device = fresh_device
 
         new_data = {
             "deviceName": "Updated Name",
@@ -117,9 +137,9 @@ class TestDeviceUpdate:
 class TestDeviceDataUpdate:
     """Test device data update methods."""
 
-    def test_update_data_empty(self):
+    def test_update_data_empty(self, fresh_device):
         """Test update_data with empty list."""
-        device = Device({})
+        device = fresh_device
 
         # Store initial values
         initial_temp = device.temperature
@@ -129,9 +149,9 @@ class TestDeviceDataUpdate:
         # Values should remain unchanged
         assert device.temperature == initial_temp
 
-    def test_update_data_single_point(self):
+    def test_update_data_single_point(self, fresh_device, assert_sensors):
         """Test update_data with single data point."""
-        device = Device({})
+        device = fresh_device
 
         data_points = [
             {"temperature": 22.5, "humidity": 45.0, "co2": 800, "pm25": 12.3}
@@ -139,14 +159,11 @@ class TestDeviceDataUpdate:
 
         device.update_data(data_points, _USER_SETTINGS)
 
-        assert device.temperature == 22.5
-        assert device.humidity == 45.0
-        assert device.co2 == 800.0
-        assert device.pm25 == 12.3
+        assert_sensors(device, temperature=22.5, humidity=45.0, co2=800.0, pm25=12.3)
 
-    def test_update_data_multiple_points(self):
+    def test_update_data_multiple_points(self, fresh_device, assert_sensors):
         """Test update_data with multiple data points (averaging)."""
-        device = Device({})
+        device = fresh_device
 
         data_points = [
             {"temperature": 20.0, "humidity": 40.0, "co2": 700},
@@ -156,14 +173,12 @@ class TestDeviceDataUpdate:
 
         device.update_data(data_points, _USER_SETTINGS)
 
-        # Averages: temp = (20+22+24)/3 = 22.0, humidity = (40+45+50)/3 = 45.0
-        assert device.temperature == 22.0
-        assert device.humidity == 45.0
-        assert device.co2 == 750.0  # (700+750+800)/3 = 750
+        # Averages: temp = (20+22+24)/3, humidity = (40+45+50)/3, co2 = (700+750+800)/3
+        assert_sensors(device, temperature=22.0, humidity=45.0, co2=750.0)
 
-    def test_update_data_with_missing_values(self):
+    def test_update_data_with_missing_values(self, fresh_device):
         """Test update_data with some missing values in data points."""
-        device = Device({})
+        device = fresh_device
 
         data_points = [
             {"temperature": 20.0, "humidity": 40.0},
@@ -178,9 +193,9 @@ class TestDeviceDataUpdate:
         assert device.temperature == 14.0
         assert device.humidity == 30.0
 
-    def test_update_data_sets_timestamp(self):
+    def test_update_data_sets_timestamp(self, fresh_device):
         """Test that update_data sets the timestamp from the last data point."""
-        device = Device({})
+        device = fresh_device
 
         data_points = [
             {"temperature": 20.0, "timestamp": 1000},
@@ -192,9 +207,9 @@ class TestDeviceDataUpdate:
 
         assert device.timestamp == 3000
 
-    def test_update_data_all_sensor_fields(self):
+    def test_update_data_all_sensor_fields(self, fresh_device, assert_sensors):
         """Test update_data with all sensor fields."""
-        device = Device({})
+        device = fresh_device
 
         data_points = [
             {
@@ -226,36 +241,42 @@ class TestDeviceDataUpdate:
         device.update_data(data_points, _USER_SETTINGS)
 
         # Check a few fields
-        assert device.virus_index == 2.5
-        assert device.mold_index == 1.8
-        assert device.temperature == 22.5
-        assert device.humidity == 45.0
-        assert device.pm25 == 12.3
-        assert device.tvoc == 150.0
-        assert device.co2 == 800.0
-        assert device.co == 0.5
+        assert_sensors(
+            device,
+            virus_index=2.5,
+            mold_index=1.8,
+            temperature=22.5,
+            humidity=45.0,
+            pm25=12.3,
+            tvoc=150.0,
+            co2=800.0,
+            co=0.5,
+        )
 
 
 class TestDeviceAttributeNames:
     """Test attribute name conversion."""
 
-    def test_to_attr_name_conversion(self):
-        """Test _to_attr_name method."""
-        device = Device({})
-
-        # Test camelCase to snake_case conversion
-        assert device._to_attr_name("virusIndex") == "virus_index"
-        assert device._to_attr_name("pm25") == "pm25"  # No conversion needed
-        assert device._to_attr_name("airPressure") == "air_pressure"
-        assert device._to_attr_name("deviceName") == "device_name"
-        assert device._to_attr_name("serialNumber") == "serial_number"
-
-    def test_sensor_fields_attributes(self):
+    @pytest.mark.parametrize(
+        "key, expected",
+        [
+            ("virusIndex", "virus_index"),
+            ("pm25", "pm25"),  # No conversion needed
+            ("airPressure", "air_pressure"),
+            ("deviceName", "device_name"),
+            ("serialNumber", "serial_number"),
+        ],
+    )
+    def test_to_attr_name_conversion(self, fresh_device, key, expected):
+        """Test _to_attr_name camelCase to snake_case conversion."""
+        assert fresh_device._to_attr_name(key) == expected
+
+    def test_sensor_fields_attributes(self, fresh_device):
         """Test that all sensor fields have corresponding attributes."""
-        device = Device({})
+        device = fresh_device
 
-        for field in Device.SENSOR_FIELDS:
-            attr_name = device._to_attr_name(field)
-            assert hasattr(device, attr_name)
-            # Initial value should be 0.0
-            assert getattr(device, attr_name) == 0.0
+        # Initial value of each mapped attribute should be 0.0
+        not_initialized = {
+            attr for attr in _ATTR_NAMES.values() if getattr(device, attr, None) != 0.0
+        }
+        assert not_initialized == set()